@@ -27,7 +27,7 @@ from .scoring import (
 )
 from .intent_lock import load_intent_lock, IntentLock
 from .audit_log import append_log
-from .policies import ALLOWLIST_KEYWORDS, HIGH_IMPACT_VERBS
+from .policies import ALLOWLIST_KEYWORDS
 
 
 def _normalize(proposal: Proposal) -> Proposal:
@@ -40,11 +40,8 @@ def _normalize(proposal: Proposal) -> Proposal:
 
 def _classify_action(text: str) -> str:
     """Infer action type from proposal text."""
-    from .policies import ACTION_TYPE_HINTS
-    for action_type, pattern in ACTION_TYPE_HINTS.items():
-        if pattern.search(text):
-            return action_type
-    return "unknown"
+    from .policies import classify_action
+    return classify_action(text) or "unknown"
 
 
 def _authenticate(lock: IntentLock | None) -> CheckResult | None:
@@ -214,13 +211,26 @@ def evaluate(
     # ── Step 1: Normalize ──
     proposal = _normalize(proposal)
 
-    # Anti-obfuscation: normalize text to canonical form before any checks
-    # Handles: Unicode homoglyphs, leetspeak, word-splitting, base64, HTML entities
-    from .normalizer import normalize_proposal_text
-    proposal.text, proposal.raw_input = normalize_proposal_text(
-        proposal.text, proposal.raw_input
+    # A proposal with no text, input, grants, context, or tool cannot trip
+    # any protocol check — every check scores 0 on empty fields. Skip the
+    # normalizer and check pipeline; auth, scope, intent, and rate steps
+    # still run, so the verdict is identical.
+    trivially_empty = not (
+        proposal.text
+        or proposal.raw_input
+        or proposal.grants
+        or proposal.context
+        or proposal.tool_name
     )
 
+    if not trivially_empty:
+        # Anti-obfuscation: normalize text to canonical form before any checks
+        # Handles: Unicode homoglyphs, leetspeak, word-splitting, base64, HTML entities
+        from .normalizer import normalize_proposal_text
+        proposal.text, proposal.raw_input = normalize_proposal_text(
+            proposal.text, proposal.raw_input
+        )
+
     # ── Step 2: Authenticate ──
     lock = load_intent_lock(lock_path)
     auth_result = _authenticate(lock)
@@ -253,7 +263,7 @@ def evaluate(
         )
 
     # ── Step 5: Protocol Check ──
-    protocol_results = run_all_checks(proposal)
+    protocol_results = [] if trivially_empty else run_all_checks(proposal)
 
     # Combine all check results
     all_results: list[CheckResult] = list(protocol_results)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import re
@@ -20,6 +21,12 @@ def _sha(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
+@functools.lru_cache(maxsize=512)
+def _compiled(pattern: str) -> re.Pattern:
+    """Compile an allow_commands pattern once — scopes re-check the same patterns constantly."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
 @dataclass
 class Scope:
     """Defines the allowed boundaries for a session."""
@@ -49,7 +56,7 @@ class Scope:
             return True
         if not self.allow_commands:
             return False
-        return any(re.search(pattern, proposal, re.IGNORECASE) for pattern in self.allow_commands)
+        return any(_compiled(pattern).search(proposal) for pattern in self.allow_commands)
 
 
 @dataclass
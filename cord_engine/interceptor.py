@@ -35,6 +35,7 @@ from __future__ import annotations
 import functools
 import inspect
 import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, TypeVar, Protocol
@@ -101,6 +102,10 @@ class VerdictCallback(Protocol):
 # Proposal builder — maps tool arguments into CORD Proposal fields
 # ---------------------------------------------------------------------------
 
+# Compiled once — build_proposal runs on every guarded tool call, and the
+# re module's per-call cache lookup is measurable on that path.
+_URL_HOST = re.compile(r"https?://([^\s/]+)")
+
 def build_proposal(
     tool_name: str,
     args: tuple,
@@ -161,14 +166,13 @@ def build_proposal(
 
     # -- Network tools --
     elif tool_name in ("network", "browser", "fetch", "request", "http"):
-        import re
         for v in all_values:
-            url_match = re.search(r"https?://([^\s/]+)", str(v))
+            url_match = _URL_HOST.search(str(v))
             if url_match:
                 network_target = url_match.group(1)
                 break
         if "url" in kwargs:
-            url_match = re.search(r"https?://([^\s/]+)", str(kwargs["url"]))
+            url_match = _URL_HOST.search(str(kwargs["url"]))
             if url_match:
                 network_target = url_match.group(1)
 
@@ -93,5 +93,8 @@ class Verdict:
         d["decision"] = self.decision.value
         return d
 
-    def to_json(self, indent: int = 2) -> str:
+    def to_json(self, indent: int | None = 2) -> str:
+        if indent is None:
+            # Compact wire format for logging/transport
+            return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
         return json.dumps(self.to_dict(), indent=indent)
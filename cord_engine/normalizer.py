@@ -16,6 +16,7 @@ Techniques defended against:
 from __future__ import annotations
 
 import base64
+import functools
 import re
 import unicodedata
 
@@ -23,33 +24,49 @@ import unicodedata
 # ---------------------------------------------------------------------------
 # Zero-width and invisible Unicode characters to strip.
 # ---------------------------------------------------------------------------
-_ZERO_WIDTH = re.compile(
-    r"[\u200b\u200c\u200d\u200e\u200f\ufeff\u00ad\u2028\u2029\u180e\u2060]"
+# str.translate with a precomputed table deletes these in a single C-level
+# pass — cheaper than a character-class regex sub.
+_ZERO_WIDTH_TRANS = str.maketrans(
+    "", "", "\u200b\u200c\u200d\u200e\u200f\ufeff\u00ad\u2028\u2029\u180e\u2060"
 )
 
 # ---------------------------------------------------------------------------
 # Leetspeak substitution table.
 # ---------------------------------------------------------------------------
+# Characters with structural meaning (HTML tags, template delimiters, paths)
+# must never be rewritten — converting them would break downstream detection.
+# The set is consulted once at import while building the translate table;
+# the hot path only pays for the C-level translate call.
+_STRUCTURAL = frozenset("<>([{}])/\\")
+
 _LEET_MAP = str.maketrans({
-    "0": "o", "1": "i", "3": "e", "4": "a",
-    "5": "s", "6": "g", "7": "t", "8": "b",
-    "@": "a", "$": "s", "!": "i", "|": "i",
-    "+": "t",
-    # NOTE: < ( [ are intentionally excluded — they have structural meaning
-    # (HTML tags, template delimiters) and converting them would break detection.
+    char: repl
+    for char, repl in {
+        "0": "o", "1": "i", "3": "e", "4": "a",
+        "5": "s", "6": "g", "7": "t", "8": "b",
+        "@": "a", "$": "s", "!": "i", "|": "i",
+        "+": "t",
+    }.items()
+    if char not in _STRUCTURAL
 })
 
 # ---------------------------------------------------------------------------
 # HTML entity patterns → decoded form.
 # ---------------------------------------------------------------------------
-_HTML_ENTITIES = [
-    (re.compile(r"&lt;", re.IGNORECASE), "<"),
-    (re.compile(r"&gt;", re.IGNORECASE), ">"),
-    (re.compile(r"&amp;", re.IGNORECASE), "&"),
-    (re.compile(r"&quot;", re.IGNORECASE), '"'),
-    (re.compile(r"&#x([0-9a-fA-F]+);"), lambda m: chr(int(m.group(1), 16))),
-    (re.compile(r"&#(\d+);"), lambda m: chr(int(m.group(1)))),
-]
+_NAMED_ENTITIES = {"lt": "<", "gt": ">", "amp": "&", "quot": '"'}
+
+# One combined pattern handles named, hex, and decimal entities in a single
+# sub() pass instead of six sequential scans.
+_HTML_ENTITY = re.compile(r"&(?:(lt|gt|amp|quot)|#x([0-9a-fA-F]+)|#(\d+));", re.IGNORECASE)
+
+
+def _decode_entity(match: re.Match) -> str:
+    name, hex_code, dec_code = match.groups()
+    if name:
+        return _NAMED_ENTITIES[name.lower()]
+    if hex_code is not None:
+        return chr(int(hex_code, 16))
+    return chr(int(dec_code))
 
 # ---------------------------------------------------------------------------
 # Word-splitting pattern — single chars separated by spaces/dashes/dots/underscores.
@@ -57,6 +74,23 @@ _HTML_ENTITIES = [
 # ---------------------------------------------------------------------------
 _WORD_SPLIT = re.compile(r"(?<!\w)((?:[a-zA-Z0-9][\s\.\-_]){2,}[a-zA-Z0-9])(?!\w)")
 
+# Separator chars inside a split word, and runs of excess whitespace —
+# compiled once so the hot path never hits the re module cache.
+_SPLIT_SEPARATORS = re.compile(r"[\s\.\-_]")
+_EXCESS_WHITESPACE = re.compile(r"[ \t]{2,}")
+
+# ---------------------------------------------------------------------------
+# Fast-path trigger scan — anything the pipeline could possibly rewrite.
+# ASCII text with no match here passes through normalize() untouched, so we
+# can return it after a single scan instead of running all seven steps.
+# ---------------------------------------------------------------------------
+_FAST_PATH_TRIGGERS = re.compile(
+    r"[0-9@$!|+&\t]"                                    # leet chars, entities, tabs
+    r"|[ ]{2,}"                                          # collapsible whitespace
+    r"|[A-Za-z/]{20,}"                                   # possible base64 blob
+    r"|(?<!\w)(?:[a-zA-Z][\s.\-_]){2,}[a-zA-Z](?!\w)"    # split-word shape
+)
+
 # ---------------------------------------------------------------------------
 # Base64 detection — long base64-looking strings in text.
 # ---------------------------------------------------------------------------
@@ -64,33 +98,47 @@ _B64_CANDIDATE = re.compile(r"(?:[A-Za-z0-9+/]{20,}={0,2})")
 
 
 def _decode_b64_candidates(text: str) -> str:
-    """Try to decode suspicious base64 blobs — if they decode to readable text, include both."""
-    def try_decode(match: re.Match) -> str:
-        candidate = match.group(0)
+    """Try to decode suspicious base64 blobs — if they decode to readable text, include both.
+
+    Single finditer pass; the common no-candidate case returns the input
+    untouched without building any intermediate strings.
+    """
+    parts: list[str] = []
+    pos = 0
+    for match in _B64_CANDIDATE.finditer(text):
         try:
-            decoded = base64.b64decode(candidate + "==").decode("utf-8", errors="strict")
-            # Only substitute if it decoded to readable ASCII text
-            if decoded.isprintable() and len(decoded) > 4:
-                return f"{candidate} {decoded}"
+            decoded = base64.b64decode(match.group(0) + "==").decode("utf-8", errors="strict")
         except Exception:
-            pass
-        return candidate
-
-    return _B64_CANDIDATE.sub(try_decode, text)
+            continue
+        # Only substitute if it decoded to readable ASCII text
+        if decoded.isprintable() and len(decoded) > 4:
+            parts.append(text[pos:match.end()])
+            parts.append(f" {decoded}")
+            pos = match.end()
+
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return "".join(parts)
 
 
 def _collapse_word_splits(text: str) -> str:
     """Collapse split characters back into words: 'i g n o r e' → 'ignore'."""
     def rejoin(match: re.Match) -> str:
         fragment = match.group(1)
-        return re.sub(r"[\s\.\-_]", "", fragment)
+        return _SPLIT_SEPARATORS.sub("", fragment)
 
     return _WORD_SPLIT.sub(rejoin, text)
 
 
+@functools.lru_cache(maxsize=256)
 def normalize(text: str) -> str:
     """Normalize text to its canonical form for safe pattern matching.
 
+    Pure function of its input, so results are memoized — evaluate() runs it
+    on both text and raw_input, and agents frequently resubmit identical
+    proposals within a session.
+
     Applies in order:
     1. Unicode normalization (NFKC) — fullwidth, homoglyphs, ligatures
     2. Zero-width character removal
@@ -106,18 +154,21 @@ def normalize(text: str) -> str:
     if not text:
         return text
 
+    # Fast path: plain ASCII with none of the characters any step rewrites —
+    # the pipeline would be a no-op, so skip it after one cheap scan.
+    if text.isascii() and _FAST_PATH_TRIGGERS.search(text) is None:
+        return text
+
     # Step 1: Unicode NFKC normalization (handles fullwidth, ligatures, etc.)
-    result = unicodedata.normalize("NFKC", text)
+    # NFKC is the identity on ASCII, so skip it for ASCII text that reached
+    # here via other triggers (leetspeak, entities, whitespace runs).
+    result = text if text.isascii() else unicodedata.normalize("NFKC", text)
 
     # Step 2: Strip zero-width / invisible characters
-    result = _ZERO_WIDTH.sub("", result)
+    result = result.translate(_ZERO_WIDTH_TRANS)
 
     # Step 3: HTML entity decoding
-    for pattern, replacement in _HTML_ENTITIES:
-        if callable(replacement):
-            result = pattern.sub(replacement, result)
-        else:
-            result = pattern.sub(replacement, result)
+    result = _HTML_ENTITY.sub(_decode_entity, result)
 
     # Step 4: Base64 expansion
     result = _decode_b64_candidates(result)
@@ -129,7 +180,7 @@ def normalize(text: str) -> str:
     result = result.translate(_LEET_MAP)
 
     # Step 7: Collapse excessive whitespace
-    result = re.sub(r"[ \t]{2,}", " ", result)
+    result = _EXCESS_WHITESPACE.sub(" ", result)
 
     # Return normalized form. If original differs, include both so patterns
     # can match against the canonical form.
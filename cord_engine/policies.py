@@ -1,12 +1,21 @@
-"""CORD policy configuration — weights, thresholds, patterns, and classifications."""
+"""CORD policy configuration — weights, thresholds, patterns, and classifications.
 
+Every table here is frozen (MappingProxyType, tuple, frozenset): the engine
+never mutates policy at runtime, so readers on concurrent scoring paths can
+share the constants without locking, and accidental writes fail loudly.
+"""
+
+from __future__ import annotations
+
+import functools
 import re
+from types import MappingProxyType
 
 # ---------------------------------------------------------------------------
 # Dimension weights — how heavily each protocol dimension is scored.
 # Higher weight = more influence on the final composite score.
 # ---------------------------------------------------------------------------
-WEIGHTS = {
+WEIGHTS = MappingProxyType({
     # Article-mapped dimensions
     "long_term_alignment": 3,    # Art I  — Prime Directive
     "moral_check": 5,            # Art II — Moral Constraints (highest)
@@ -31,22 +40,30 @@ WEIGHTS = {
     "pii_leakage": 4,        # PII exposure risk
     "rate_anomaly": 3,       # Frequency-based anomaly
     "tool_risk": 1,          # Tool-tier baseline signal (additive, not primary)
-}
+})
 
 # ---------------------------------------------------------------------------
 # Decision thresholds — composite score boundaries.
 # ---------------------------------------------------------------------------
-THRESHOLDS = {
+THRESHOLDS = MappingProxyType({
     "allow": 3,       # score < 3 → ALLOW
     "contain": 5,     # 3 ≤ score < 5 → CONTAIN
     "challenge": 7,   # 5 ≤ score < 7 → CHALLENGE
     "block": 7,       # score ≥ 7 → BLOCK
-}
+})
 
 # ---------------------------------------------------------------------------
 # Regex patterns for security detection.
 # ---------------------------------------------------------------------------
-PATTERNS = {
+
+# re.ASCII is applied only to patterns whose sole metaclass is \b, where
+# the ASCII rule is strictly stricter (never fewer matches). It must NOT
+# touch patterns containing \s: Unicode whitespace like U+0085 (NEL) and
+# U+1680 (ogham space) survives normalization — NFKC leaves both alone —
+# so an ASCII \s would let "transfer\u0085funds" slip past detection.
+_ASCII_FLAGS = re.IGNORECASE | re.ASCII
+
+PATTERNS = MappingProxyType({
     "injection": re.compile(
         r"(<<|{{|}}\s*--|;\s*--|"
         r"\bunion\b|\bdrop\b|\binsert\b|\bexec\b|\bshutdown\b|"
@@ -68,47 +85,126 @@ PATTERNS = {
         r"system\s+prompts?)",
         re.IGNORECASE,
     ),
-}
+})
+
+# Union of all three security families — one scan answers "does anything
+# match?" for the common clean input instead of three independent passes.
+# On a hit we re-confirm per family: the families share literals (e.g.
+# "curl https:" is both injection and exfil), so a single finditer over the
+# union cannot attribute overlapping matches correctly.
+_SECURITY_SCAN = re.compile(
+    "|".join(pattern.pattern for pattern in PATTERNS.values()),
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def scan_security(text: str) -> frozenset[str]:
+    """Return the security pattern families that match text.
+
+    Clean text — the overwhelmingly common case — costs one pass over the
+    fused pattern. Only texts that trip the union pay for the per-family
+    searches. Memoized: several checks scan the same proposal text within
+    one evaluation, and agents resubmit identical proposals across
+    challenge/confirm loops.
+    """
+    if _SECURITY_SCAN.search(text) is None:
+        return frozenset()
+    return frozenset(name for name, pattern in PATTERNS.items() if pattern.search(text))
+
 
 # ---------------------------------------------------------------------------
 # High-impact verbs — actions that raise irreversibility risk.
+# A frozenset: consumers either test membership (O(1)) or feed the whole
+# vocabulary to the trie compiler below, where order is irrelevant.
 # ---------------------------------------------------------------------------
-HIGH_IMPACT_VERBS = [
+HIGH_IMPACT_VERBS = frozenset({
     "delete", "drop", "shutdown", "format", "wipe",
     "disable", "lock", "kill", "terminate", "overwrite",
     "purge", "destroy", "truncate", "revoke", "erase",
     "rm", "remove", "uninstall",
-]
+})
+
+def _trie_regex(words: frozenset[str]) -> str:
+    """Compile a word list into a prefix-sharing regex alternation.
+
+    A flat alternation retries every branch from scratch on each failure;
+    factoring shared prefixes into nested groups (re → rm|remove|revoke)
+    lets the matcher discard whole families after one mismatched character.
+    Matches exactly the same words as '|'.join(words).
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # terminal marker — a word ends here
+
+    def emit(node: dict) -> str:
+        # Group sibling characters by their subtree's regex so characters
+        # sharing an identical suffix collapse into one character class
+        # ([dk]ill-style) instead of separate alternatives.
+        suffixes: dict[str, list[str]] = {}
+        for char, child in sorted(node.items()):
+            if char:
+                suffixes.setdefault(emit(child), []).append(char)
+
+        branches = []
+        for suffix, chars in suffixes.items():
+            if len(chars) == 1:
+                branches.append(re.escape(chars[0]) + suffix)
+            else:
+                branches.append("[" + "".join(map(re.escape, chars)) + "]" + suffix)
+        branches.sort()
+
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 and "" not in node else (
+            "(?:" + "|".join(branches) + ")"
+        )
+        return body + "?" if "" in node else body
+
+    return emit(trie)
+
 
 # Word-boundary regex — prevents substring collisions like "lock" in "block"
 # or "rm" in "performance". Always use this instead of bare `in` checks.
+# Built via the trie compiler so common prefixes are factored once.
 HIGH_IMPACT_VERBS_PATTERN = re.compile(
-    r'\b(' + '|'.join(HIGH_IMPACT_VERBS) + r')\b',
-    re.IGNORECASE,
+    r'\b(' + _trie_regex(HIGH_IMPACT_VERBS) + r')\b',
+    _ASCII_FLAGS,
 )
 
 # ---------------------------------------------------------------------------
 # Allowlist keywords — signals that reduce risk (preview, dry-run, etc.).
 # ---------------------------------------------------------------------------
-ALLOWLIST_KEYWORDS = [
+ALLOWLIST_KEYWORDS = (
     "read-only", "preview", "dry-run", "simulate", "list",
     "status", "check", "verify", "inspect", "view",
     "describe", "explain", "show", "query", "search",
-]
+)
 
 # ---------------------------------------------------------------------------
 # Moral hard-block patterns — instant BLOCK, no scoring needed.
 # These map to Article II prohibitions.
 # ---------------------------------------------------------------------------
+
+# Impersonation phrases shared verbatim by Article II (moral) and Article XI
+# (identity). Written once so the two patterns cannot drift apart and the
+# duplicated alternation source is compiled from a single fragment.
+_IMPERSONATION_CORE = (
+    r"pretend\s+to\s+be\s+(?:a\s+)?human|"
+    r"as\s+if\s+i\s+am\b|as\s+if\s+you\s+are\b|"
+    r"pose\s+as|masquerade\s+as|"
+    r"the\s+human\s+owner|acting\s+as\s+the\s+human"
+)
+
 MORAL_BLOCK_PATTERNS = re.compile(
     r"(steal|fraud|blackmail|extort|coerce|"
     r"impersonate|forge|counterfeit|phish|"
     r"exploit\s+vuln|hack\s+into|breach\s+security|"
     r"harm\s+\w+|threaten|deceive\s+\w+|manipulate\s+\w+|"
-    r"pretend\s+to\s+be\s+(a\s+)?human|"
-    r"as\s+if\s+i\s+am\b|as\s+if\s+you\s+are\b|"
-    r"pose\s+as|masquerade\s+as|"
-    r"the\s+human\s+owner|acting\s+as\s+the\s+human|"
+    + _IMPERSONATION_CORE + r"|"
     # Behavioral extortion — coercion described without using the keyword
     r"unless\s+(they|you|he|she|we|i)\s+(pay|comply|agree|cooperate|transfer)|"
     r"compromising\s+(photos?|images?|videos?|materials?|info|information|data|documents?|evidence)|"
@@ -118,15 +214,28 @@ MORAL_BLOCK_PATTERNS = re.compile(
 
 # Regex patterns specifically for Article XI identity checks (non-contiguous patterns)
 IDENTITY_VIOLATION_PATTERNS = re.compile(
-    r"(pretend\s+to\s+be\s+(a\s+)?human|"
-    r"as\s+if\s+i\s+am\b|as\s+if\s+you\s+are\b|"
+    r"(" + _IMPERSONATION_CORE + r"|"
     r"\bimpersonate\b|claim\s+to\s+be|"
-    r"pose\s+as|masquerade\s+as|"
-    r"the\s+human\s+owner|acting\s+as\s+the\s+human|"
     r"respond.*as.*human|present.*as.*human)",
     re.IGNORECASE,
 )
 
+# ---------------------------------------------------------------------------
+# Protocol drift signals — attempts to mutate or disable the rules themselves.
+# Any hit is an instant hard block (Article VIII).
+# ---------------------------------------------------------------------------
+DRIFT_SIGNALS = (
+    "override constitution", "override protocols", "ignore rules",
+    "bypass policy", "disable safety", "turn off checks",
+    "skip validation", "modify core values", "change the rules",
+)
+
+# Single combined scan — one pass over the text instead of one per phrase.
+DRIFT_SIGNAL_PATTERNS = re.compile(
+    "|".join(re.escape(signal) for signal in DRIFT_SIGNALS),
+    re.IGNORECASE,
+)
+
 # ---------------------------------------------------------------------------
 # Financial risk indicators.
 # ---------------------------------------------------------------------------
@@ -169,11 +278,57 @@ PROMPT_INJECTION_PATTERNS = re.compile(
     re.IGNORECASE | re.DOTALL,
 )
 
+# ---------------------------------------------------------------------------
+# Anchor prefilters for the two heaviest patterns above.
+# Every branch of the full pattern requires one of the anchor fragments, so
+# a text with no anchor hit provably cannot match — the caller skips the
+# expensive scan. Most inputs match nothing, which makes the cheap scan the
+# common path. Plain `re` over a literal-heavy alternation stands in for an
+# Aho–Corasick automaton without adding a dependency.
+# ---------------------------------------------------------------------------
+_MORAL_ANCHORS = re.compile(
+    r"steal|fraud|blackmail|extort|coerc|impersonat|forge|counterfeit|phish|"
+    r"exploit|hack|breach|harm|threaten|deceiv|manipulat|pretend|"
+    r"as\s+if|pose\s+as|masquerade|the\s+human|acting\s+as|"
+    r"unless|compromising|leak|release|expose|publish|send",
+    re.IGNORECASE,
+)
+
+_INJECTION_ANCHORS = re.compile(
+    r"ignore|disregard|forget|new\s*instruction|override|"
+    r"you\s*are\s*now|from\s*now|act\s*as|your\s*new|pretend|"
+    r"jailbreak|dan\s*mode|developer\s*mode|god\s*mode|unrestricted\s*mode|"
+    r"<\||</?system>|\[/?inst\]|\[system\]|###|"
+    r"the\s*(?:following|above)|translate|"
+    r"after\s*(?:reading|processing|translating|summarizing)",
+    re.IGNORECASE,
+)
+
+
+# Both helpers are memoized like normalize() — match objects are immutable,
+# and repeated evaluations of the same text are common.
+
+@functools.lru_cache(maxsize=1024)
+def moral_block_search(text: str):
+    """MORAL_BLOCK_PATTERNS.search with the anchor prefilter in front."""
+    if _MORAL_ANCHORS.search(text) is None:
+        return None
+    return MORAL_BLOCK_PATTERNS.search(text)
+
+
+@functools.lru_cache(maxsize=1024)
+def prompt_injection_search(text: str):
+    """PROMPT_INJECTION_PATTERNS.search with the anchor prefilter in front."""
+    if _INJECTION_ANCHORS.search(text) is None:
+        return None
+    return PROMPT_INJECTION_PATTERNS.search(text)
+
+
 # ---------------------------------------------------------------------------
 # PII patterns — personally identifiable information that shouldn't be
 # transmitted, stored, or processed without explicit consent.
 # ---------------------------------------------------------------------------
-PII_PATTERNS = {
+PII_PATTERNS = MappingProxyType({
     "ssn": re.compile(r"\b\d{3}-\d{2}-\d{4}\b|\b\d{9}\b"),
     "credit_card": re.compile(
         r"\b(?:4[0-9]{12}(?:[0-9]{3})?|"           # Visa
@@ -187,7 +342,7 @@ PII_PATTERNS = {
     "ip_address": re.compile(
         r"\b(?:(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\.){3}(?:25[0-5]|2[0-4]\d|[01]?\d\d?)\b"
     ),
-}
+})
 
 # PII field names that appear in data payloads (keys, column names, etc.)
 PII_FIELD_NAMES = re.compile(
@@ -195,13 +350,13 @@ PII_FIELD_NAMES = re.compile(
     r"date_of_birth|dob|passport|drivers_license|"
     r"medical_record|health_record|diagnosis|prescription|"
     r"bank_account|routing_number|tax_id|ein|itin)\b",
-    re.IGNORECASE,
+    _ASCII_FLAGS,
 )
 
 # ---------------------------------------------------------------------------
 # Tool risk tiers — different tools carry different baseline risk.
 # ---------------------------------------------------------------------------
-TOOL_RISK_TIERS = {
+TOOL_RISK_TIERS = MappingProxyType({
     "exec":    3.0,   # Shell execution — highest risk
     "write":   1.5,   # File write — moderate
     "edit":    1.0,   # File edit — low
@@ -210,16 +365,35 @@ TOOL_RISK_TIERS = {
     "read":    0.0,   # Read-only — no additional risk
     "query":   0.0,   # Query — no additional risk
     "message": 1.5,   # Messaging — moderate (external communication)
-}
+})
 
 # ---------------------------------------------------------------------------
 # Action type classification hints.
 # ---------------------------------------------------------------------------
-ACTION_TYPE_HINTS = {
+ACTION_TYPE_HINTS = MappingProxyType({
     "command": re.compile(r"(^(git|npm|pip|docker|kubectl|sudo|apt|brew|make)\s)", re.IGNORECASE),
     "file_op": re.compile(r"(write|read|edit|create|delete|move|copy|rename)\s+(file|dir|folder|path)", re.IGNORECASE),
     "network": re.compile(r"(curl|wget|fetch|request|api\s+call|http|upload|download)", re.IGNORECASE),
     "financial": re.compile(r"(buy|sell|pay|transfer|invest|trade|purchase|invoice)", re.IGNORECASE),
     "communication": re.compile(r"(send|email|message|post|publish|tweet|reply|comment)", re.IGNORECASE),
     "system": re.compile(r"(install|uninstall|configure|chmod|chown|mount|systemctl|service)", re.IGNORECASE),
-}
+})
+
+# Union of every hint — one scan settles the common "no category matches"
+# case. On a hit we fall back to the priority-ordered per-category search:
+# classification follows dict order, not leftmost-match order, so a tagged
+# lastgroup scan would misclassify texts matching several categories.
+_ACTION_TYPE_UNION = re.compile(
+    "|".join(pattern.pattern for pattern in ACTION_TYPE_HINTS.values()),
+    re.IGNORECASE,
+)
+
+
+def classify_action(text: str) -> str | None:
+    """Return the first action type whose hint pattern matches, or None."""
+    if not text or _ACTION_TYPE_UNION.search(text) is None:
+        return None
+    for action_type, pattern in ACTION_TYPE_HINTS.items():
+        if pattern.search(text):
+            return action_type
+    return None
@@ -6,22 +6,37 @@ Hard blocks bypass the scoring engine entirely.
 
 from __future__ import annotations
 
+import functools
+import re
+
 from .models import Proposal, CheckResult
 from .policies import (
     PATTERNS,
     HIGH_IMPACT_VERBS,
     HIGH_IMPACT_VERBS_PATTERN,
     ALLOWLIST_KEYWORDS,
-    MORAL_BLOCK_PATTERNS,
+    DRIFT_SIGNAL_PATTERNS,
     FINANCIAL_RISK_PATTERNS,
     IDENTITY_VIOLATION_PATTERNS,
-    PROMPT_INJECTION_PATTERNS,
     PII_PATTERNS,
     PII_FIELD_NAMES,
     TOOL_RISK_TIERS,
+    scan_security,
+    moral_block_search,
+    prompt_injection_search,
 )
 
 
+@functools.lru_cache(maxsize=256)
+def _lower(text: str) -> str:
+    """Case-fold once per distinct text.
+
+    Nearly every check lowercases the same proposal string; memoizing the
+    fold turns eight copies per evaluation into one.
+    """
+    return text.lower()
+
+
 # ── Article I — Prime Directive ──────────────────────────────────────────────
 
 def check_prime_directive(proposal: Proposal) -> CheckResult:
@@ -31,7 +46,7 @@ def check_prime_directive(proposal: Proposal) -> CheckResult:
     """
     score = 0.0
     reasons: list[str] = []
-    text = proposal.text.lower()
+    text = _lower(proposal.text)
 
     short_term_signals = [
         "quick fix", "hack around", "skip test", "ignore warning",
@@ -65,7 +80,7 @@ def check_moral_constraints(proposal: Proposal) -> CheckResult:
     reasons: list[str] = []
     text = proposal.text
 
-    if MORAL_BLOCK_PATTERNS.search(text):
+    if moral_block_search(text):
         reasons.append(f"Moral violation detected — Article II prohibits this action")
         return CheckResult(
             dimension="moral_check",
@@ -77,8 +92,9 @@ def check_moral_constraints(proposal: Proposal) -> CheckResult:
 
     deception_signals = ["hide from", "cover up", "mislead", "fake", "fabricate"]
     score = 0.0
+    lowered = _lower(text)
     for signal in deception_signals:
-        if signal in text.lower():
+        if signal in lowered:
             score += 2.0
             reasons.append(f"Deception signal: '{signal}'")
 
@@ -97,7 +113,7 @@ def check_truth_integrity(proposal: Proposal) -> CheckResult:
     """Is the action based on verified information? Does it fabricate claims?"""
     score = 0.0
     reasons: list[str] = []
-    text = proposal.text.lower()
+    text = _lower(proposal.text)
 
     fabrication_signals = [
         "make up", "invent data", "fake results", "fabricate",
@@ -126,7 +142,7 @@ def check_consequence_analysis(proposal: Proposal) -> CheckResult:
     """Have second-order consequences been evaluated?"""
     score = 0.0
     reasons: list[str] = []
-    text = proposal.text.lower()
+    text = _lower(proposal.text)
 
     # High-impact actions without consequence analysis
     is_high_impact = bool(HIGH_IMPACT_VERBS_PATTERN.search(text))
@@ -212,24 +228,28 @@ def check_security(proposal: Proposal) -> CheckResult:
     text = proposal.text
     grants = proposal.grants
 
+    # One fused pass decides all three families for clean text
+    families = scan_security(text)
+
     # Injection risk
-    if PATTERNS["injection"].search(text):
+    if "injection" in families:
         score += 2.0
         reasons.append("Injection risk — hostile pattern detected")
 
     # Exfiltration risk
-    if PATTERNS["exfil"].search(text):
+    if "exfil" in families:
         score += 2.0
         reasons.append("Data exfiltration risk — outbound data transfer detected")
 
     # Secrets exposure
-    if PATTERNS["secrets"].search(text):
+    if "secrets" in families:
         score += 1.5
         reasons.append("Secrets exposure risk — sensitive credential pattern detected")
 
     # Privilege escalation — only flag genuinely elevated grants, not normal write scopes
+    # One verb scan feeds both the privilege and irreversibility rules.
     dangerous = bool(HIGH_IMPACT_VERBS_PATTERN.search(text))
-    elevated = any(
+    elevated = dangerous and any(
         g for g in grants
         if any(p in g.lower() for p in ["admin", "sudo", "root", "write:system"])
     )
@@ -240,10 +260,9 @@ def check_security(proposal: Proposal) -> CheckResult:
         score += 1.0
         reasons.append("High-impact verb detected — requires caution")
 
-    # Irreversibility
-    irreversible = bool(HIGH_IMPACT_VERBS_PATTERN.search(text))
-    reversible_hint = any(k in text.lower() for k in ALLOWLIST_KEYWORDS)
-    if irreversible and not reversible_hint:
+    # Irreversibility — the allowlist hint only matters when a verb matched
+    reversible_hint = dangerous and any(k in _lower(text) for k in ALLOWLIST_KEYWORDS)
+    if dangerous and not reversible_hint:
         score += 2.0
         reasons.append("Irreversible action without safety indicators (dry-run, preview, etc.)")
 
@@ -264,26 +283,17 @@ def check_security(proposal: Proposal) -> CheckResult:
 
 def check_drift(proposal: Proposal) -> CheckResult:
     """Core values are immutable. Only capability adapts."""
-    score = 0.0
-    reasons: list[str] = []
-    text = proposal.text.lower()
+    text = _lower(proposal.text)
 
-    drift_signals = [
-        "override constitution", "override protocols", "ignore rules",
-        "bypass policy", "disable safety", "turn off checks",
-        "skip validation", "modify core values", "change the rules",
-    ]
-    for signal in drift_signals:
-        if signal in text:
-            score += 3.0
-            reasons.append(f"Protocol drift attempt: '{signal}' — Protocols I-III are immutable")
-            return CheckResult(
-                dimension="drift_check",
-                article="Article VIII — Learning & Adaptation",
-                score=min(score, 5.0),
-                reasons=reasons,
-                hard_block=True,
-            )
+    match = DRIFT_SIGNAL_PATTERNS.search(text)
+    if match:
+        return CheckResult(
+            dimension="drift_check",
+            article="Article VIII — Learning & Adaptation",
+            score=3.0,
+            reasons=[f"Protocol drift attempt: '{match.group(0)}' — Protocols I-III are immutable"],
+            hard_block=True,
+        )
 
     return CheckResult(
         dimension="drift_check",
@@ -309,7 +319,7 @@ def check_evaluation_framework(proposal: Proposal) -> CheckResult:
     reasons: list[str] = []
 
     # Check if the proposal has significant impact and lacks structured assessment
-    text = proposal.text.lower()
+    text = _lower(proposal.text)
     # Financial actions only trigger Article IX above a meaningful threshold ($100)
     financial_significant = proposal.context.get("financial_amount", 0) >= 100
     is_significant = (
@@ -350,7 +360,7 @@ def check_temperament(proposal: Proposal) -> CheckResult:
     """Response tone: calm, rational, no ego, no manipulation."""
     score = 0.0
     reasons: list[str] = []
-    text = proposal.text.lower()
+    text = _lower(proposal.text)
 
     escalation_signals = [
         "threaten", "ultimatum", "demand immediate", "or else",
@@ -375,7 +385,7 @@ def check_identity(proposal: Proposal) -> CheckResult:
     """Agent stays in role. No pretense, no ego, no approval-seeking."""
     score = 0.0
     reasons: list[str] = []
-    text = proposal.text.lower()
+    text = _lower(proposal.text)
 
     match = IDENTITY_VIOLATION_PATTERNS.search(text)
     if match:
@@ -410,7 +420,7 @@ def check_prompt_injection(proposal: "Proposal") -> CheckResult:
         targets.append(proposal.raw_input)
 
     for target in targets:
-        match = PROMPT_INJECTION_PATTERNS.search(target)
+        match = prompt_injection_search(target)
         if match:
             score += 4.0
             reasons.append(
@@ -423,7 +433,8 @@ def check_prompt_injection(proposal: "Proposal") -> CheckResult:
     if proposal.source == "external" and not score:
         # Heuristic: external input with unusual command-like density
         imperative_verbs = ["ignore", "forget", "disregard", "override", "instead", "now do"]
-        hits = sum(1 for v in imperative_verbs if v in proposal.text.lower())
+        lowered = _lower(proposal.text)
+        hits = sum(1 for v in imperative_verbs if v in lowered)
         if hits >= 2:
             score += 1.5
             reasons.append(
@@ -443,6 +454,9 @@ def check_prompt_injection(proposal: "Proposal") -> CheckResult:
 
 # ── PII Leakage Detection (Article VII extension) ────────────────────────────
 
+_HAS_DIGIT = re.compile(r"\d")
+
+
 def check_pii_leakage(proposal: "Proposal") -> CheckResult:
     """Detect PII in outbound communications, file writes, or network calls.
 
@@ -457,8 +471,14 @@ def check_pii_leakage(proposal: "Proposal") -> CheckResult:
     # Combine all text to scan
     scan_target = " ".join(filter(None, [proposal.text, proposal.raw_input]))
 
+    # Every PII family except email requires at least one digit — one cheap
+    # scan lets digit-free text (most proposals) skip the four numeric patterns.
+    digits_present = _HAS_DIGIT.search(scan_target) is not None
+
     # Check each PII type
     for pii_type, pattern in PII_PATTERNS.items():
+        if pii_type != "email" and not digits_present:
+            continue
         if pattern.search(scan_target):
             # Email in outbound contexts is only medium risk — it's often intentional
             weight = 1.0 if pii_type == "email" else 2.0
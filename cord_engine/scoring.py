@@ -5,13 +5,19 @@ from __future__ import annotations
 from .models import Decision, CheckResult
 from .policies import WEIGHTS, THRESHOLDS
 
+# Hot-path snapshots — the public dicts stay the configuration surface, but
+# the per-call lookups below resolve to locals bound once at import.
+_WEIGHT_FOR = WEIGHTS.get
+_T_BLOCK = THRESHOLDS["block"]
+_T_CHALLENGE = THRESHOLDS["challenge"]
+_T_CONTAIN = THRESHOLDS["contain"]
+
 
 def compute_composite_score(check_results: list[CheckResult]) -> float:
     """Compute a weighted composite score from all check results."""
     total = 0.0
     for result in check_results:
-        weight = WEIGHTS.get(result.dimension, 1)
-        total += result.score * weight
+        total += result.score * _WEIGHT_FOR(result.dimension, 1)
     return total
 
 
@@ -37,11 +43,11 @@ def decide(score: float, check_results: list[CheckResult]) -> Decision:
     if has_hard_block(check_results):
         return Decision.BLOCK
 
-    if score >= THRESHOLDS["block"]:
+    if score >= _T_BLOCK:
         return Decision.BLOCK
-    if score >= THRESHOLDS["challenge"]:
+    if score >= _T_CHALLENGE:
         return Decision.CHALLENGE
-    if score >= THRESHOLDS["contain"]:
+    if score >= _T_CONTAIN:
         return Decision.CONTAIN
     return Decision.ALLOW
 
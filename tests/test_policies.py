@@ -7,6 +7,7 @@ decision thresholds, regex pattern matching, and tool risk tiers.
 from __future__ import annotations
 
 import re
+from collections.abc import Mapping
 
 import pytest
 
@@ -441,3 +442,30 @@ class TestFinancialPatterns:
     ])
     def test_financial_no_false_positive(self, text):
         assert not FINANCIAL_RISK_PATTERNS.search(text), f"False positive: {text}"
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Pattern Compilation
+# ═══════════════════════════════════════════════════════════════════════════
+
+class TestPatternCompilation:
+    def test_all_patterns_are_compiled(self):
+        """Every exported pattern constant must be a precompiled re.Pattern.
+
+        Raw pattern strings would push callers through the re module's
+        per-call cache lookup on every scan.
+        """
+        import cord_engine.policies as policies
+
+        for name in dir(policies):
+            if name.startswith("_"):
+                continue
+            value = getattr(policies, name)
+            if name.endswith(("_PATTERN", "_PATTERNS")) and not isinstance(value, Mapping):
+                assert isinstance(value, re.Pattern), f"{name} is not compiled"
+
+        for dict_name in ("PATTERNS", "PII_PATTERNS", "ACTION_TYPE_HINTS"):
+            for key, pattern in getattr(policies, dict_name).items():
+                assert isinstance(pattern, re.Pattern), (
+                    f"{dict_name}[{key!r}] is not compiled"
+                )